@@ -1,4 +1,6 @@
 from collections import OrderedDict
+from types import MappingProxyType
+
 from radie.structures import StructuredDataFrame, register_data_structures
 
 
@@ -11,8 +13,10 @@ class DSC(StructuredDataFrame):
 
     label = "Differential Scanning Calorimetry"
 
-    _required_metadata = StructuredDataFrame._required_metadata.copy()
-    _required_metadata['mass'] = 1. # mg, Default to 1 in case none is provided, used for normalization
+    _required_metadata = MappingProxyType({
+        **StructuredDataFrame._required_metadata,
+        'mass': 1.,  # mg, Default to 1 in case none is provided, used for normalization
+    })
 
     _x = "temperature" # celsius
     _y = "heat_flow" # mW
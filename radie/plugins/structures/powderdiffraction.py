@@ -1,5 +1,6 @@
 import numpy as np
 from collections import OrderedDict
+from types import MappingProxyType
 
 from radie.structures import StructuredDataFrame, register_data_structures
 
@@ -107,8 +108,8 @@ class PowderDiffraction(StructuredDataFrame):
 
     label = "Powder Diffraction"
 
-    _required_metadata = StructuredDataFrame._required_metadata.copy()
-    _required_metadata.update({
+    _required_metadata = MappingProxyType({
+        **StructuredDataFrame._required_metadata,
         "wavelength": CuKa,
         "source": "",
     })
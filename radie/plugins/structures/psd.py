@@ -1,4 +1,5 @@
 from collections import OrderedDict
+from types import MappingProxyType
 
 import numpy as np
 from radie.structures import StructuredDataFrame, register_data_structures
@@ -12,8 +13,8 @@ class PSD(StructuredDataFrame):
 
     label = "PSD"
 
-    _required_metadata = StructuredDataFrame._required_metadata.copy()
-    _required_metadata.update({
+    _required_metadata = MappingProxyType({
+        **StructuredDataFrame._required_metadata,
         "refractive_index": "1.0",
         "distribution_mode": "volume",
         "ultrasound_time": 0,  # ultrasound time in seconds
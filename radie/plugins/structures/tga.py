@@ -13,8 +13,6 @@ class TGA(StructuredDataFrame):
 
     label = "Thermogravimetric Analysis"
 
-    _required_metadata = StructuredDataFrame._required_metadata.copy()
-
     _x = "time" # minutes
     _y = "weight" # mg
     _z = "temperature" # celsius
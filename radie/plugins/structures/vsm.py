@@ -1,4 +1,5 @@
-from collections import OrderedDict
+from types import MappingProxyType
+
 from radie.structures import StructuredDataFrame, register_data_structures
 
 
@@ -11,8 +12,8 @@ class VSM(StructuredDataFrame):
 
     label = "VSM"
 
-    _required_metadata = StructuredDataFrame._required_metadata.copy()
-    _required_metadata.update({
+    _required_metadata = MappingProxyType({
+        **StructuredDataFrame._required_metadata,
         "mass": 1,
         "density": 1
     })
@@ -20,10 +21,10 @@ class VSM(StructuredDataFrame):
     _x = "Field"
     _y = "Moment"
 
-    _required_columns = OrderedDict((
-        ("Field", float),
-        ("Moment", float),
-    ))
+    _required_columns = {
+        "Field": float,
+        "Moment": float,
+    }
     _column_properties = []
     _loaders = []
 
@@ -1,2 +1,2 @@
 class DFTypeError(TypeError):
-    pass
\ No newline at end of file
+    __slots__ = ()
\ No newline at end of file
@@ -2,16 +2,122 @@ import typing
 from collections import OrderedDict
 
 
+def _newIndexableDict(cls):
+    """create an empty instance of an IndexableDict (sub-)class without calling its
+    __init__, used to copy and unpickle, where the items and attributes are restored
+    afterwards"""
+    new = cls.__new__(cls)
+    IndexableDict.__init__(new)
+    return new
+
+
 class IndexableDict(OrderedDict):
     """
     A class that defines an ordered dictionary where the items are indexable with common slicing operations as well
     as by the dict key.  We can also retrieve the 'row' of the item as an integer by providing the key, or the value,
     in which case row will return the first instance of value
+
+    The keys and values are mirrored in lists by row, and their rows are tracked in
+    reverse-index dicts, all kept in sync as items are set and deleted, so that neither
+    positional access nor row lookups require a scan of the dict.  Copies and unpickled
+    instances rebuild these from the items
     """
 
+    __slots__ = ("_keys", "_values", "_key_row", "_value_row")
+
+    def __init__(self, *args, **kwargs):
+        self._keys = []  # keys in row order
+        self._values = []  # values in row order
+        self._key_row = {}  # key -> row
+        self._value_row = {}  # id(value) -> row of the first occurrence of value
+        super(IndexableDict, self).__init__(*args, **kwargs)
+
+    def __setitem__(self, key, value):
+        row = self._key_row.get(key)
+        if row is None:
+            row = len(self._keys)
+            self._keys.append(key)
+            self._values.append(value)
+            self._key_row[key] = row
+            super(IndexableDict, self).__setitem__(key, value)
+            self._value_row.setdefault(id(value), row)
+        else:
+            super(IndexableDict, self).__setitem__(key, value)
+            self._values[row] = value
+            self._reindexValues()
+
+    def __delitem__(self, key):
+        super(IndexableDict, self).__delitem__(key)
+        row = self._key_row.pop(key)
+        del self._keys[row]
+        del self._values[row]
+        for i in range(row, len(self._keys)):
+            self._key_row[self._keys[i]] = i
+        self._reindexValues()
+
+    def pop(self, key, *default):
+        if key not in self._key_row:
+            if default:
+                return default[0]
+            raise KeyError(key)
+        value = super(IndexableDict, self).__getitem__(key)
+        del self[key]
+        return value
+
+    def popitem(self, last=True):
+        if not self._keys:
+            raise KeyError("dictionary is empty")
+        key = self._keys[-1] if last else self._keys[0]
+        return key, self.pop(key)
+
+    def move_to_end(self, key, last=True):
+        super(IndexableDict, self).move_to_end(key, last)
+        self._keys = list(super(IndexableDict, self).keys())
+        self._values = list(super(IndexableDict, self).values())
+        self._key_row = {key: row for row, key in enumerate(self._keys)}
+        self._reindexValues()
+
+    def clear(self):
+        super(IndexableDict, self).clear()
+        self._keys.clear()
+        self._values.clear()
+        self._key_row.clear()
+        self._value_row.clear()
+
+    def _slotState(self):
+        """the slot attributes of sub-classes, i.e. everything but the row indices"""
+        state = {}
+        for cls in type(self).__mro__:
+            for name in cls.__dict__.get("__slots__", ()):
+                if name not in IndexableDict.__slots__ and hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return state
+
+    def __reduce__(self):
+        slots = self._slotState()
+        state = (self.__dict__ or None, slots) if self.__dict__ or slots else None
+        return _newIndexableDict, (type(self),), state, None, iter(list(self.items()))
+
+    def __copy__(self):
+        new = _newIndexableDict(type(self))
+        new.__dict__.update(self.__dict__)
+        for name, value in self._slotState().items():
+            setattr(new, name, value)
+        for key, value in self.items():
+            new[key] = value
+        return new
+
+    def copy(self):
+        return self.__copy__()
+
+    def _reindexValues(self):
+        self._value_row.clear()
+        for row, value in enumerate(self._values):
+            self._value_row.setdefault(id(value), row)
+
     def __getitem__(self, key):
         if type(key) is slice:
-            return tuple(self.values())[key]
+            return tuple(self._values[key])
 
         # can only use this functionality with slice because ints are valid dict keys, leaving here until I'm sure
         # all such uses are gone
@@ -35,7 +141,7 @@ class IndexableDict(OrderedDict):
         -------
         typing.Any
         """
-        return tuple(self)[index]
+        return self._keys[index]
 
     def getValue(self, index):
         """
@@ -49,7 +155,7 @@ class IndexableDict(OrderedDict):
         -------
         typing.Any
         """
-        return tuple(self.values())[index]
+        return self._values[index]
 
     def getKeyAndValue(self, row):
         """
@@ -89,11 +195,15 @@ class IndexableDict(OrderedDict):
         -------
         int
         """
-        return tuple(self).index(key)
+        try:
+            return self._key_row[key]
+        except KeyError:
+            raise ValueError("{:} is not in the dict".format(key))
 
     def getValueRow(self, value):
         """
-        return the position of the first occurence of value in the dict
+        return the position of the first occurence of value itself in the dict, or
+        failing that, of the first value equal to it
 
         Parameters
         ----------
@@ -103,4 +213,10 @@ class IndexableDict(OrderedDict):
         -------
         int
         """
-        return tuple(self.values()).index(value)
+        row = self._value_row.get(id(value))
+        if row is not None:
+            return row
+        try:
+            return self._values.index(value)
+        except ValueError:
+            raise ValueError("value is not in the dict")
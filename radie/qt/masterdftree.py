@@ -3,12 +3,50 @@ define a QAbstractItemModel for a an Ordered Dict of an OrderedDict of
 DataFrames, and also a TreeView of the Items
 """
 
+from collections import OrderedDict
+from contextlib import contextmanager
+from operator import attrgetter
+import weakref
+
 from PyQt5 import QtCore, QtWidgets
 
 from .indexabledict import IndexableDict
-from ..structures import StructuredDataFrame
+from ..structures import StructuredDataFrame, is_registered
 from . import dataframeview
 
+_REF_FLAGS = QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable | \
+    QtCore.Qt.ItemIsEditable | QtCore.Qt.ItemIsDragEnabled | QtCore.Qt.ItemIsDropEnabled
+_NODE_FLAGS = QtCore.Qt.ItemFlags(QtCore.Qt.ItemIsEnabled)
+_DEFAULT_FLAGS = QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+
+# custom role returning a dict of the Display and Edit roles of an index in a single call
+MultipleRolesRole = QtCore.Qt.UserRole + 1
+
+
+def _none(item):
+    return None
+
+
+def _allRoles(getter):
+    def roles(item):
+        value = getter(item)
+        return {QtCore.Qt.DisplayRole: value, QtCore.Qt.EditRole: value}
+    return roles
+
+
+# DFTreeModel.data dispatch table,
+# (pointer._is_leaf, column, role) -> function of the pointer returning the data
+_DATA_FNS = {}
+for _tag, _column, _getter in (
+        (False, 0, attrgetter("_name")),  # DataStructureNode class name
+        (True, 0, attrgetter("_name")),  # DFReference name
+        (True, 1, attrgetter("_uuid_str")),  # DFReference uuid
+):
+    _DATA_FNS[_tag, _column, QtCore.Qt.DisplayRole] = _getter
+    _DATA_FNS[_tag, _column, QtCore.Qt.EditRole] = _getter
+    _DATA_FNS[_tag, _column, MultipleRolesRole] = _allRoles(_getter)
+del _tag, _column, _getter
+
 
 class DataStructureTree(IndexableDict):
     """The main StructuredDataFrame tree Construct
@@ -19,13 +57,15 @@ class DataStructureTree(IndexableDict):
     the available instances of those classes
 
     """
+    __slots__ = ("_node_of",)
+
     def __init__(self):
         super(DataStructureTree, self).__init__()
-        self.uuid = {}  # a place to track down DataFrames by uuid
+        self._node_of = {}  # integer uuid -> the DataStructureNode holding that DataFrame
 
     def __setitem__(self, key, value):
-        if not issubclass(key, StructuredDataFrame):
-            raise TypeError("key must be a subclass of StructuredDataFrame")
+        if not is_registered(key):
+            raise TypeError("key must be a registered subclass of StructuredDataFrame")
         if not isinstance(value, DataStructureNode):
             raise TypeError("DFStructureTree items must be of type DataStructureNode")
         super(DataStructureTree, self).__setitem__(key, value)
@@ -42,9 +82,8 @@ class DataStructureTree(IndexableDict):
         ref : DFReference
 
         """
-        uuid = df.get_uuid()
-        if uuid in self.uuid.keys():
-            raise ValueError("df already exists")
+        self.checkDataFrame(df)
+        uuid = df.get_uuid_int()
         insert_row = -1
 
         cls = df.__class__
@@ -53,15 +92,45 @@ class DataStructureTree(IndexableDict):
             node = self[cls] = DataStructureNode(cls, self)
             insert_row = len(self)
         ref = node[uuid] = DFReference(df, node)
-        self.uuid[uuid] = ref
+        self._node_of[uuid] = node
 
         return ref, node, insert_row
 
+    def checkDataFrame(self, df):
+        """raise an exception if df cannot be added to the tree, so that callers can
+        validate df before they start modifying anything
+
+        Parameters
+        ----------
+        df : StructuredDataFrame
+
+        """
+        if not is_registered(df.__class__):
+            raise TypeError("df must be an instance of a registered "
+                            "StructuredDataFrame class")
+        if df.get_uuid_int() in self._node_of:
+            raise ValueError("df already exists")
+
+    def lookup(self, uuid):
+        """find the reference to a DataFrame in the tree by its uuid
+
+        Parameters
+        ----------
+        uuid : int
+            the integer uuid of the DataFrame, see StructuredDataFrame.get_uuid_int
+
+        Returns
+        -------
+        ref : DFReference
+
+        """
+        return self._node_of[uuid][uuid]
+
 
 class DataStructureNode(IndexableDict):
     """A foldable node on the TreeView, one for each class of StructuredDataFrame
 
-    A dict whose keys are a uuid string generated by the
+    A dict whose keys are the integer uuid generated by the
     StructuredDataFrame instance, and the values are a reference to
     the StructuredDataFrame of the class specified by the cls
     attribute
@@ -69,64 +138,107 @@ class DataStructureNode(IndexableDict):
     Attributes
     ----------
     tree : DataStructureTree
-        A reference to the parent tree
+        A weak reference to the parent tree
     cls : typing.Type(StructuredDataFrame)
         The subclass of StructuredDataFrame that all members of this
         node belong to
 
     """
+    __slots__ = ("cls", "_tree", "_name")
+
+    _is_leaf = False
+
     def __init__(self, cls, tree):
         self.cls = cls  # type: StructuredDataFrame
-        self.tree = tree  # type: DataStructureTree
+        self._tree = weakref.ref(tree)
+        self._name = cls.__name__  # display value cached for the model
         super(DataStructureNode, self).__init__()
 
+    @property
+    def tree(self):
+        """
+        Returns
+        -------
+        DataStructureTree
+        """
+        return self._tree()
+
     def parent(self):
         return self.tree
 
     def row(self):
         return self.tree.getKeyRow(self.cls)
 
-    def pop(self, key):
-        reference = super(DataStructureNode, self).pop(key)  # type: DFReference
-        reference.dfDeleted.emit(reference)
+    def __delitem__(self, key):
+        reference = self[key]  # type: DFReference
+        super(DataStructureNode, self).__delitem__(key)
+        self.tree._node_of.pop(key, None)
+        referenceSignals.dfDeleted.emit(reference)
+
+    def clear(self):
+        for key in list(self):
+            del self[key]
 
     def __setitem__(self, key, value):
-        if not isinstance(key, str):
-            raise TypeError("keys must be a uuid string")
+        if not isinstance(key, int):
+            raise TypeError("keys must be an integer uuid")
         elif not isinstance(value, DFReference):
             raise TypeError("value must be of type {:}".format(DFReference.__name__))
 
         super(DataStructureNode, self).__setitem__(key, value)
 
 
-class DFReference(QtCore.QObject):
-    """A QObject which serves as a reference to a DataFrame instance, and
-       can emit Qt Signals when needed
+class DFReferenceSignals(QtCore.QObject):
+    """Qt Signals shared by all DFReference instances, emitted with the
+       DFReference concerned as the argument
+    """
+    dataChanged = QtCore.pyqtSignal(object)
+    dfDeleted = QtCore.pyqtSignal(object)
+
+
+referenceSignals = DFReferenceSignals()
+
+
+class DFReference(object):
+    """A reference to a DataFrame instance, whose Qt Signals are emitted
+       through the module level `referenceSignals`
 
     Attributes
     ----------
     df : StructuredDataFrame
         The instance of a DataFrame that this reference refers to
     node : DataStructureNode
-        a reference to the parent node of this reference
+        a weak reference to the parent node of this reference
     row : int
         the location of this item in the node
 
     """
-    dataChanged = QtCore.pyqtSignal()
-    dfDeleted = QtCore.pyqtSignal(object)
+    __slots__ = ("_df", "_node", "_name", "_uuid_str")
+
+    _is_leaf = True
 
     def __init__(self, df: StructuredDataFrame, node: DataStructureNode):
         if not isinstance(df, StructuredDataFrame):
             raise TypeError("df must be a StructuredDataFrame")
         self._df = df
-        self.node = node
-        super(DFReference, self).__init__()
+        self._node = weakref.ref(node) if node is not None else None
+        # display values cached for the model, see DFTreeModel.setData
+        self._name = df.metadata["name"]
+        self._uuid_str = df.get_uuid()
 
     @property
     def df(self):
         return self._df
 
+    @property
+    def node(self):
+        """
+        Returns
+        -------
+        DataStructureNode
+        """
+        return self._node() if self._node is not None else None
+
     def parent(self):
         return self.node
 
@@ -139,7 +251,14 @@ class DFReference(QtCore.QObject):
 
 
 class DFTreeModel(QtCore.QAbstractItemModel):
+    """Model of a DataStructureTree
+
+    The rows of each DataStructureNode are exposed to views lazily through
+    canFetchMore/fetchMore, `fetchSize` rows at a time, so that a node's
+    references are only materialized once the node is expanded
+    """
     headers = ["Name", "uuid"]
+    fetchSize = 200
 
     def __init__(self, root, parent=None):
         """
@@ -150,6 +269,9 @@ class DFTreeModel(QtCore.QAbstractItemModel):
         """
         super(DFTreeModel, self).__init__(parent)
         self.root = root
+        # StructuredDataFrame class -> number of rows of its node exposed to views
+        self._fetched = {}
+        self._batching = False
         for i, header in enumerate(self.headers):
             self.setHeaderData(i, QtCore.Qt.Horizontal, header)
 
@@ -177,6 +299,8 @@ class DFTreeModel(QtCore.QAbstractItemModel):
         if cls not in self.root.keys():
             if not create:
                 raise IndexError
+            if not is_registered(cls):  # fail before the model starts inserting
+                raise TypeError("cls must be a registered StructuredDataFrame class")
 
             row = len(self.root)
             self.beginInsertRows(rootIndex, row, row)
@@ -194,9 +318,25 @@ class DFTreeModel(QtCore.QAbstractItemModel):
         row = index.row()
         self.beginRemoveRows(self.parent(index), row, row)
         node = df.parent()
-        node.pop(df.df.uuid)
+        node.pop(df.df.get_uuid_int())
+        self._fetched[node.cls] -= 1
         self.endRemoveRows()
 
+    @contextmanager
+    def batch(self):
+        """context manager that wraps a bulk update of the tree in a single model reset
+
+        Inside the block, addDataFrame adds to the tree without emitting any
+        row signals, attached views are reset once when the block exits
+        """
+        self.beginResetModel()
+        self._batching = True
+        try:
+            yield self
+        finally:
+            self._batching = False
+            self.endResetModel()
+
     def addDataFrame(self, df):
         """
         API for adding new dataframes after the model has been initiated
@@ -205,22 +345,55 @@ class DFTreeModel(QtCore.QAbstractItemModel):
         ----------
         df : StructuredDataFrame
 
+        Returns
+        -------
+        nodeIndex : QtCore.QModelIndex
+            the index of the structure node of df, None inside of a `batch`
+
         """
+        self.root.checkDataFrame(df)  # fail before the model starts inserting
+        if self._batching:
+            self.root.addDataFrame(df)
+            return None
+
         cls = df.__class__
         nodeIndex = self.structureNodeIndex(cls, create=True)
         node = nodeIndex.internalPointer()
         row = len(node)
-        self.beginInsertRows(nodeIndex, row, row)
-        self.root.addDataFrame(df)
-        self.endInsertRows()
+        if self._fetched.get(cls, 0) < row:
+            # the node has not been fully fetched, the new row is exposed by fetchMore
+            self.root.addDataFrame(df)
+        else:
+            self.beginInsertRows(nodeIndex, row, row)
+            self.root.addDataFrame(df)
+            self._fetched[cls] = row + 1
+            self.endInsertRows()
         return nodeIndex
 
+    def canFetchMore(self, parent: QtCore.QModelIndex) -> bool:
+        if not parent.isValid():
+            return False
+        node = parent.internalPointer()
+        if node._is_leaf:
+            return False
+        return self._fetched.get(node.cls, 0) < len(node)
+
+    def fetchMore(self, parent: QtCore.QModelIndex):
+        node = parent.internalPointer()  # type: DataStructureNode
+        first = self._fetched.get(node.cls, 0)
+        last = min(len(node), first + self.fetchSize) - 1
+        if last < first:
+            return
+        self.beginInsertRows(parent, first, last)
+        self._fetched[node.cls] = last + 1
+        self.endInsertRows()
+
     def parent(self, child: QtCore.QModelIndex) -> QtCore.QModelIndex:
         if not child.isValid():
             return QtCore.QModelIndex()
 
         item = child.internalPointer()
-        if isinstance(item, DFReference):
+        if item._is_leaf:  # item is DFReference
             node = item.parent()
             row = node.row()
             return self.createIndex(row, 0, node)
@@ -230,7 +403,9 @@ class DFTreeModel(QtCore.QAbstractItemModel):
     def rowCount(self, parent: QtCore.QModelIndex = ...) -> int:
         if parent.isValid():
             pointer = parent.internalPointer()
-            return pointer.rowCount()
+            if pointer._is_leaf:
+                return 0
+            return self._fetched.get(pointer.cls, 0)
         else:
             return self.root.rowCount()
 
@@ -238,36 +413,24 @@ class DFTreeModel(QtCore.QAbstractItemModel):
         return 2  # 1: class_name or FamilyMember.name | 2: FamilyMember.age
 
     def hasChildren(self, parent: QtCore.QModelIndex = ...) -> bool:
-        item = parent.internalPointer()
-        if isinstance(item, DFReference):
-            return False
-        else:
+        if not parent.isValid():
             return True
+        item = parent.internalPointer()
+        # rows of a node may not be fetched yet, so do not rely on rowCount
+        return not item._is_leaf and len(item) > 0
 
     def data(self, index: QtCore.QModelIndex, role: int = ...):
         if not index.isValid():
             return None
-        if role in (QtCore.Qt.DisplayRole, QtCore.Qt.EditRole):
-            item = index.internalPointer()
-            if isinstance(item, DataStructureNode):
-                if index.column() == 0:
-                    return item.cls.__name__
-            elif isinstance(item, DFReference):
-                if index.column() == 0:
-                    return item._df.metadata["name"]
-                elif index.column() == 1:
-                    return item._df.get_uuid()
-                else:
-                    return None
-        else:  # Not display or Edit
-            return None
+        item = index.internalPointer()
+        return _DATA_FNS.get((item._is_leaf, index.column(), role), _none)(item)
 
     def setData(self, index: QtCore.QModelIndex, value, role: int = ...):
         item = index.internalPointer()
         col = index.column()
         if isinstance(item, DFReference):
             if col == 0:
-                item._df.metadata["name"] = str(value)
+                item._df.metadata["name"] = item._name = str(value)
             else:
                 return False
             self.dataChanged.emit(index, index)
@@ -277,40 +440,107 @@ class DFTreeModel(QtCore.QAbstractItemModel):
     def flags(self, index: QtCore.QModelIndex):
         if not index.isValid():
             return QtCore.Qt.NoItemFlags
-        item = index.internalPointer()
-        if isinstance(item, DFReference):
-            return QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsEditable | \
-                   QtCore.Qt.ItemIsDragEnabled | QtCore.Qt.ItemIsDropEnabled
-        elif isinstance(item, DataStructureNode):
-            return QtCore.Qt.ItemIsEnabled
+        item_type = type(index.internalPointer())
+        if item_type is DFReference:
+            return _REF_FLAGS
+        elif item_type is DataStructureNode:
+            return _NODE_FLAGS
         else:
-            return QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+            return _DEFAULT_FLAGS
+
+
+class DFTreeDelegate(QtWidgets.QStyledItemDelegate):
+    """Item delegate that fetches the painting roles of an index with one call to
+    the model via `MultipleRolesRole`, rather than one call per role
+
+    Only the roles carried by the `MultipleRolesRole` dict are painted, which for
+    DFTreeModel is the DisplayRole.  A role added to the model has to be added to
+    the dict built by `_allRoles` and handled in `initStyleOption` as well.
+
+    The role dicts of the most recently painted indices are kept in a small LRU
+    cache which is cleared whenever the watched model reports a change, or is
+    replaced through `setModel`, which DFTreeView calls from its own setModel.
+
+    Parameters
+    ----------
+    parent : QtWidgets.QWidget
+    """
+    cacheSize = 256
+
+    def __init__(self, parent=None):
+        super(DFTreeDelegate, self).__init__(parent)
+        self._cache = OrderedDict()
+        self._model = None
+
+    def _modelSignals(self):
+        model = self._model
+        return (model.dataChanged, model.rowsInserted, model.rowsRemoved,
+                model.modelReset, model.layoutChanged)
+
+    def setModel(self, model: QtCore.QAbstractItemModel):
+        """watch the signals of model rather than those of the previous model"""
+        if self._model is not None:
+            for signal in self._modelSignals():
+                signal.disconnect(self.clearCache)
+        self._model = model
+        if model is not None:
+            for signal in self._modelSignals():
+                signal.connect(self.clearCache)
+        self.clearCache()
+
+    def clearCache(self, *args):
+        self._cache.clear()
+
+    def roleData(self, index: QtCore.QModelIndex):
+        key = (index.internalId(), index.column())
+        roles = self._cache.get(key)
+        if roles is None:
+            roles = index.data(MultipleRolesRole) or {}
+            self._cache[key] = roles
+            if len(self._cache) > self.cacheSize:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+        return roles
+
+    def initStyleOption(self, option: QtWidgets.QStyleOptionViewItem,
+                        index: QtCore.QModelIndex):
+        roles = self.roleData(index)
+        option.index = index
+
+        value = roles.get(QtCore.Qt.DisplayRole)
+        if value is not None:
+            option.features |= QtWidgets.QStyleOptionViewItem.HasDisplay
+            option.text = self.displayText(value, option.locale)
 
 
 class DFTreeView(QtWidgets.QTreeView):
+    # addDataFrames resets the model rather than inserting rows above this many
+    batchThreshold = 10
+
     def __init__(self, data=None, parent=None):
         super(DFTreeView, self).__init__(parent)
         if not isinstance(data, DataStructureTree):
             self.data = DataStructureTree()
         else:
             self.data = data
+        self.setItemDelegate(DFTreeDelegate(self))
         model = DFTreeModel(self.data)
         self.setModel(model)
-        rootIndex = QtCore.QModelIndex()
-        for row in range(len(self.data)):
-            self.setExpanded(model.index(row, 0, rootIndex), True)
         self.setContextMenuPolicy(QtCore.Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self.rightClicked)
         self.setSelectionMode(self.ExtendedSelection)
         self.setDragDropMode(self.DragDrop)
 
+    def setModel(self, model: QtCore.QAbstractItemModel):
+        super(DFTreeView, self).setModel(model)
+        delegate = self.itemDelegate()
+        if isinstance(delegate, DFTreeDelegate):
+            delegate.setModel(model)
+
     def getSelectedDataFrameIndices(self):
-        selected_df_indices = list()
-        for index in self.selectionModel().selectedRows(0):  # type: QtCore.QModelIndex
-            pointer = index.internalPointer()
-            if isinstance(pointer, DFReference):
-                selected_df_indices.append(index)
-        return selected_df_indices
+        return [index for index in self.selectionModel().selectedRows(0)
+                if type(index.internalPointer()) is DFReference]
 
     def deleteSelectedDataFrames(self):
         for index in self.getSelectedDataFrameIndices():  # type: QtCore.QModelIndex
@@ -330,21 +560,21 @@ class DFTreeView(QtWidgets.QTreeView):
 
     def rightClicked(self, pos: QtCore.QPoint):
         menu = QtWidgets.QMenu()
+        QAction = QtWidgets.QAction
 
-        selected_rows = self.selectionModel().selectedRows(column=0)
-        num_dataframes = len(selected_rows)
+        num_dataframes = len(self.getSelectedDataFrameIndices())
 
         if num_dataframes > 0:
             if num_dataframes == 1:
-                deleteItem = QtWidgets.QAction("Delete StructuredDataFrame", menu)
-                viewItem = QtWidgets.QAction("View StructuredDataFrame", menu)
+                deleteItem = QAction("Delete StructuredDataFrame", menu)
+                viewItem = QAction("View StructuredDataFrame", menu)
                 viewItem.triggered.connect(self.viewSelectedDataFrame)
                 menu.addAction(viewItem)
-                copyItem = QtWidgets.QAction("Copy StructuredDataFrame", menu)
+                copyItem = QAction("Copy StructuredDataFrame", menu)
                 copyItem.triggered.connect(self.copySelectedDataFrame)
                 menu.addAction(copyItem)
             else:
-                deleteItem = QtWidgets.QAction("Delete DataFrames", menu)
+                deleteItem = QAction("Delete DataFrames", menu)
 
             deleteItem.triggered.connect(self.deleteSelectedDataFrames)
             menu.addAction(deleteItem)
@@ -354,9 +584,65 @@ class DFTreeView(QtWidgets.QTreeView):
     def addDataFrame(self, df):
         model = self.model()  # type: DFTreeModel
         nodeIndex = model.addDataFrame(df)
-        self.setExpanded(nodeIndex, True)
+        if nodeIndex is not None:  # None while the model is inside of a batch
+            self.setExpanded(nodeIndex, True)
         self.resizeColumnToContents(0)
 
+    def addDataFrames(self, dfs):
+        """add several DataFrames at once, repainting the view a single time
+
+        Parameters
+        ----------
+        dfs : typing.Iterable[StructuredDataFrame]
+
+        """
+        dfs = list(dfs)
+        model = self.model()  # type: DFTreeModel
+        self.setUpdatesEnabled(False)
+        try:
+            if len(dfs) > self.batchThreshold:
+                # a reset collapses the tree and clears the selection, so restore both
+                expanded = [cls for row, cls in enumerate(model.root)
+                            if self.isExpanded(model.index(row, 0, QtCore.QModelIndex()))]
+                selected = [index.internalPointer()
+                            for index in self.getSelectedDataFrameIndices()]
+                try:
+                    with model.batch():
+                        for df in dfs:
+                            model.addDataFrame(df)
+                finally:
+                    self.expandStructureNodes(expanded)
+                    self.selectReferences(selected)
+            else:
+                for df in dfs:
+                    model.addDataFrame(df)
+        finally:
+            self.expandStructureNodes({df.__class__ for df in dfs})
+            self.setUpdatesEnabled(True)
+        self.resizeColumnToContents(0)
+
+    def expandStructureNodes(self, classes):
+        """expand the nodes of the given StructuredDataFrame classes in the tree"""
+        model = self.model()  # type: DFTreeModel
+        for cls in classes:
+            if cls in model.root:
+                self.setExpanded(model.structureNodeIndex(cls, create=False), True)
+
+    def selectReferences(self, refs):
+        """select the rows of the given DFReferences that are exposed by the model"""
+        model = self.model()  # type: DFTreeModel
+        selection = QtCore.QItemSelection()
+        for ref in refs:
+            node = ref.node
+            if node is None or ref.df.get_uuid_int() not in node:
+                continue  # no longer in the tree
+            nodeIndex = model.structureNodeIndex(node.cls, create=False)
+            index = model.index(ref.row(), 0, nodeIndex)
+            if index.isValid():
+                selection.select(index, index)
+        flags = QtCore.QItemSelectionModel.Select | QtCore.QItemSelectionModel.Rows
+        self.selectionModel().select(selection, flags)
+
 
 def test():
     """function to test DFTree from"""
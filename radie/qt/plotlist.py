@@ -7,7 +7,7 @@ from PyQt5 import QtCore, QtGui, QtWidgets
 from ..structures import StructuredDataFrame
 from .indexabledict import IndexableDict
 from .errors import DFTypeError
-from .masterdftree import DFReference
+from .masterdftree import DFReference, referenceSignals
 from . import functions as fn
 
 
@@ -124,6 +124,7 @@ class DFListModel(QtCore.QAbstractItemModel):
         self.dflist = dflist  # type: DFItemList
         self._headers = ["Name", "x-data", "y-data"]
         self._columnCount = len(self._headers)
+        referenceSignals.dfDeleted.connect(self.referencesDeleted)
 
     def setColumnCount(self, value):
         self._columnCount = int(value)
@@ -273,18 +274,20 @@ class DFListModel(QtCore.QAbstractItemModel):
         self.beginInsertRows(QtCore.QModelIndex(), first, last)
         for ref in refs:
             self.dflist.append(ref)
-            ref.dfDeleted.connect(self.referencesDeleted)
         self.endInsertRows()
         self.itemsAdded.emit(self.dflist[first:])
 
     def referencesDeleted(self, ref: DFReference):
         """This method is called with DFReference objects are about to be deleted globally"""
+        deleted = False
         for i in reversed(range(len(self.dflist))):
             item = self.dflist[i]  # type: DFItem
             if item.ref is ref:
                 self.removeRow(i)
+                deleted = True
                 # do not break out of this loop as a plot-list may contain multiple references to the same DF
-        self.itemsDeleted.emit()
+        if deleted:  # every list hears of every deleted reference, only react to our own
+            self.itemsDeleted.emit()
 
     def deleteSelectedRows(self, indexes: list):
         selected = sorted(indexes, key=lambda index: index.row())
@@ -514,11 +517,7 @@ def test(tree=False):
     hlay = QtWidgets.QHBoxLayout(widget)
 
     tv = DFTreeView()
-    tv.addDataFrame(df1)
-    tv.addDataFrame(df2)
-    tv.addDataFrame(df3)
-    tv.addDataFrame(df4)
-    tv.addDataFrame(df5)
+    tv.addDataFrames([df1, df2, df3, df4, df5])
 
     if not tree:
         lv = DFListView()
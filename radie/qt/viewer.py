@@ -246,6 +246,7 @@ class MainWindow(QtWidgets.QMainWindow):
         mime = a0.mimeData()
         urls = mime.urls()
         err_msg = ""
+        new_dfs = []
         for url in urls:  # type: QtCore.QUrl
             fname = url.toLocalFile()
             try:
@@ -258,10 +259,18 @@ class MainWindow(QtWidgets.QMainWindow):
                 dfs = [dfs]
             for df in dfs:  # type: StructuredDataFrame
                 try:
-                    self.treeView_dataFrames.addDataFrame(df)
+                    self.treeView_dataFrames.data.checkDataFrame(df)
                 except Exception as e:
-                    err_msg += "\nError: {:}.\nSomething wrong could not load {:} as a StructuredDataFrame Object".format(str(e), df)
+                    err_msg += "\nError: {:}.\nSomething wrong could not load {:} as a " \
+                               "StructuredDataFrame Object".format(str(e), df)
                     continue
+                new_dfs.append(df)
+
+        try:
+            self.treeView_dataFrames.addDataFrames(new_dfs)
+        except Exception as e:
+            err_msg += "\nError: {:}.\nSomething wrong, not all of the DataFrames " \
+                       "could be added".format(str(e))
 
         if err_msg.strip():
             fn.error_popup(err_msg)
@@ -10,6 +10,7 @@ __all__ = [
 
 structures = OrderedDict()
 structures[StructuredDataFrame.__name__] = StructuredDataFrame
+_REGISTERED = {StructuredDataFrame}  # registered classes, for O(1) membership checks
 
 
 def register_data_structures(*sub_classes):
@@ -26,12 +27,30 @@ def register_data_structures(*sub_classes):
         if cls.__name__ in structures.keys():
             warnings.warn("overwriting {:s} df_class".format(cls.__name__))
         structures[cls.__name__] = cls
+        _REGISTERED.add(cls)
         globals()[cls.__name__] = cls  # put the class into this scope
 
         if cls.__name__ not in __all__:
             __all__.append(cls.__name__)
 
 
+def is_registered(cls):
+    """
+    whether cls is StructuredDataFrame or one of the structures registered with
+    `register_data_structures`
+
+    Parameters
+    ----------
+    cls : type
+
+    Returns
+    -------
+    bool
+
+    """
+    return cls in _REGISTERED
+
+
 def print_available_structures():
     for key in structures.keys():
         print(key)
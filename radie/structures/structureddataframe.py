@@ -107,6 +107,7 @@ class StructuredDataFrame(pandas.DataFrame):
         super(StructuredDataFrame, self).__init__(data, index, columns, dtype, copy)
         self.metadata = OrderedDict()
         self._uuid = None  # type: str
+        self._uuid_int = None  # type: int
 
         for meta_key, meta_val in self._required_metadata.items():
             val = metadata.pop(meta_key, meta_val)
@@ -219,7 +220,9 @@ class StructuredDataFrame(pandas.DataFrame):
         """
         if self.uuid:
             raise AttributeError("self.uuid is already set, specify force_new=True to set a new uuid")
-        self._uuid = str(uuid.uuid1())
+        new_uuid = uuid.uuid1()
+        self._uuid = str(new_uuid)
+        self._uuid_int = new_uuid.int
 
     def get_uuid(self):
         """get uuid.  If None, set one and then return it"""
@@ -227,6 +230,13 @@ class StructuredDataFrame(pandas.DataFrame):
             self.set_uuid()
         return self.uuid
 
+    def get_uuid_int(self):
+        """get uuid as a 128-bit integer, for use as a dict key.  If None, set one and
+        then return it"""
+        if not self.uuid:
+            self.set_uuid()
+        return self._uuid_int
+
     @classmethod
     def loaders(cls):
         """get a list of all the Loader objects known to return this specific data structure